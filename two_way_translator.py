@@ -4,119 +4,215 @@ Combines ASL-to-Voice and Voice-to-ASL functionality in a single application.
 """
 
 import numpy as np
-import math
 import cv2
 import os
 import sys
+import glob
 import traceback
 import time
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pyttsx3
 import speech_recognition as sr
+import tensorflow as tf
 from keras.models import load_model
 from cvzone.HandTrackingModule import HandDetector
 from string import ascii_uppercase
 import enchant
+from voice_to_asl import ASLImageGenerator
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk, ImageDraw, ImageFont
+from PIL import Image, ImageTk
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
 
 # Initialize global components
 ddd = enchant.Dict("en-US")
 hd = HandDetector(maxHands=1)
-hd2 = HandDetector(maxHands=1)
 offset = 29
 
+# Camera panel size; webcam frames are normally captured at this size already
+CAM_WIDTH, CAM_HEIGHT = 640, 480
+
 os.environ["THEANO_FLAGS"] = "device=cuda, assert_no_cpu_op=True"
 
 
-# ==================== ASL Image Generator (for Voice-to-ASL) ====================
+@lru_cache(maxsize=512)
+def suggest_words(word):
+    """Spelling suggestions for a partial word, cached across lookups"""
+    return tuple(ddd.suggest(word))
+
+
+def put_latest(q, item):
+    """Put item on a single-slot queue, dropping the stale item if there is one"""
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    q.put_nowait(item)
+
 
-class ASLImageGenerator:
-    """Generates ASL hand sign images locally"""
+# ==================== Sign Classifier (for ASL-to-Voice) ====================
+
+class SignClassifier:
+    """Runs the ASL CNN on 400x400 hand skeleton images
     
-    ASL_DESCRIPTIONS = {
-        'a': "Fist with thumb beside", 'b': "Flat hand, thumb tucked",
-        'c': "Curved hand, C-shape", 'd': "Index up, others touch thumb",
-        'e': "Fingers bent, thumb tucked", 'f': "OK sign, 3 fingers up",
-        'g': "Point sideways", 'h': "Point sideways, 2 fingers",
-        'i': "Pinky up, fist", 'j': "Pinky up, draw J",
-        'k': "Index & middle up, thumb between", 'l': "L-shape, thumb & index",
-        'm': "3 fingers over thumb", 'n': "2 fingers over thumb",
-        'o': "O-shape, fingers touch thumb", 'p': "K hand, point down",
-        'q': "G hand, point down", 'r': "Cross index & middle",
-        's': "Fist, thumb over fingers", 't': "Thumb between index & middle",
-        'u': "Index & middle together up", 'v': "Peace sign / Victory",
-        'w': "3 fingers up spread", 'x': "Index bent hook",
-        'y': "Thumb & pinky out (hang loose)", 'z': "Index draws Z in air",
-    }
+    backend='auto' tries, in order: ONNX Runtime (CUDA, then CPU) when
+    onnxruntime is installed; OpenCV DNN when this OpenCV build has the OpenVINO
+    backend; TFLite; and finally Keras. The ONNX backends export the Keras model
+    with tf2onnx on first use. precision selects the TFLite conversion: 'fp32',
+    'fp16' (weights stored as float16) or 'int8' (full integer quantization
+    calibrated on the AtoZ_3.1 training images, taking uint8 input directly).
+    Both exports are written next to the .h5 file and reused on later runs.
+    """
     
-    ASL_EMOJIS = {
-        'a': '✊', 'b': '🖐️', 'c': '👌', 'd': '☝️', 'e': '✊',
-        'f': '👌', 'g': '👉', 'h': '👉', 'i': '🤙', 'j': '🤙',
-        'k': '✌️', 'l': '🤟', 'm': '✊', 'n': '✊', 'o': '👌',
-        'p': '👇', 'q': '👇', 'r': '✌️', 's': '✊', 't': '✊',
-        'u': '✌️', 'v': '✌️', 'w': '🤟', 'x': '☝️', 'y': '🤙',
-        'z': '☝️',
-    }
+    BACKENDS = ('onnxruntime', 'opencv', 'tflite')
     
-    def __init__(self, cache_dir=None):
-        self.cache_dir = cache_dir or os.path.join(os.path.dirname(__file__), 'asl_images')
-        os.makedirs(self.cache_dir, exist_ok=True)
-        self.image_cache = {}
-        
-    def create_asl_image(self, letter, size=(300, 300)):
-        """Create an ASL hand sign image for a letter"""
-        letter = letter.lower()
-        cache_key = f"{letter}_{size[0]}x{size[1]}"
-        if cache_key in self.image_cache:
-            return self.image_cache[cache_key]
-        
-        img = Image.new('RGB', size, '#1a1a2e')
-        draw = ImageDraw.Draw(img)
-        
-        margin = 20
-        ellipse_bbox = [margin, margin, size[0] - margin, size[1] - margin]
-        draw.ellipse(ellipse_bbox, fill='#16213e', outline='#e94560', width=3)
-        
-        emoji = self.ASL_EMOJIS.get(letter, '🤚')
-        description = self.ASL_DESCRIPTIONS.get(letter, 'Hand sign')
-        
-        try:
-            emoji_font = ImageFont.truetype("seguiemj.ttf", 80)
-            letter_font = ImageFont.truetype("arial.ttf", 60)
-            desc_font = ImageFont.truetype("arial.ttf", 16)
-        except:
+    def __init__(self, model_path='cnn8grps_rad1_model.h5', precision='fp16', calibration_dir=None,
+                 onnx_path=None, backend='auto'):
+        self.model = load_model(model_path)
+        self.precision = precision
+        self.calibration_dir = calibration_dir or os.path.join(os.path.dirname(__file__), 'AtoZ_3.1')
+        self.onnx_path = onnx_path or os.path.splitext(model_path)[0] + '.onnx'
+        self.tflite_path = f"{os.path.splitext(model_path)[0]}.{precision}.tflite"
+        self.session = None
+        self.net = None
+        self.interpreter = None
+        self.backend = 'keras'
+        
+        candidates = self.BACKENDS if backend == 'auto' else (backend,)
+        for name in candidates:
+            if name == 'keras' or (backend == 'auto' and not self._backend_available(name)):
+                continue
             try:
-                emoji_font = ImageFont.truetype("C:/Windows/Fonts/seguiemj.ttf", 80)
-                letter_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 60)
-                desc_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 16)
-            except:
-                emoji_font = ImageFont.load_default()
-                letter_font = ImageFont.load_default()
-                desc_font = ImageFont.load_default()
-        
-        letter_text = letter.upper()
-        letter_bbox = draw.textbbox((0, 0), letter_text, font=letter_font)
-        letter_width = letter_bbox[2] - letter_bbox[0]
-        letter_x = (size[0] - letter_width) // 2
-        draw.text((letter_x, 40), letter_text, fill='#e94560', font=letter_font)
-        
-        try:
-            emoji_bbox = draw.textbbox((0, 0), emoji, font=emoji_font)
-            emoji_width = emoji_bbox[2] - emoji_bbox[0]
-            emoji_x = (size[0] - emoji_width) // 2
-            draw.text((emoji_x, 100), emoji, fill='white', font=emoji_font)
-        except:
-            pass
-        
-        desc_bbox = draw.textbbox((0, 0), description, font=desc_font)
-        desc_width = desc_bbox[2] - desc_bbox[0]
-        desc_x = (size[0] - desc_width) // 2
-        draw.text((desc_x, size[1] - 50), description, fill='#a0a0a0', font=desc_font)
-        
-        self.image_cache[cache_key] = img
-        return img
+                getattr(self, f'_init_{name}')()
+                self.backend = name
+                return
+            except Exception as e:
+                print(f"{name} backend setup failed: {e}")
+                self.session = self.net = self.interpreter = None
+        
+    @staticmethod
+    def _has_openvino():
+        """Whether this OpenCV build can run DNN models on OpenVINO"""
+        return cv2.dnn.DNN_TARGET_CPU in cv2.dnn.getAvailableTargets(cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE)
+        
+    def _backend_available(self, name):
+        """Whether backend name can be tried automatically in this environment"""
+        if name == 'onnxruntime':
+            return ort is not None
+        if name == 'opencv':
+            return self._has_openvino()
+        return True
+        
+    def _export_onnx(self):
+        """Export the Keras model to ONNX unless it was exported before"""
+        if not os.path.exists(self.onnx_path):
+            import tf2onnx
+            spec = (tf.TensorSpec((None, 400, 400, 3), tf.float32, name='input'),)
+            tf2onnx.convert.from_keras(self.model, input_signature=spec, output_path=self.onnx_path)
+            
+    def _init_onnxruntime(self):
+        """Bind a preallocated input to an ONNX Runtime session"""
+        self._export_onnx()
+        providers = [p for p in ('CUDAExecutionProvider', 'CPUExecutionProvider')
+                     if p in ort.get_available_providers()]
+        self.session = ort.InferenceSession(self.onnx_path, providers=providers)
+        self._onnx_input_name = self.session.get_inputs()[0].name
+        self._onnx_input = np.empty((1, 400, 400, 3), np.float32)
+        self._binding = self.session.io_binding()
+        self._binding.bind_output(self.session.get_outputs()[0].name)
+        
+    def _init_opencv(self):
+        """Load the ONNX model into OpenCV DNN, on OpenVINO when it is available"""
+        self._export_onnx()
+        self.net = cv2.dnn.readNetFromONNX(self.onnx_path)
+        if self._has_openvino():
+            self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE)
+        else:
+            self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+        self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+        # The exported graph keeps Keras's NHWC input layout, so no blobFromImage
+        self._dnn_input = np.zeros((1, 400, 400, 3), np.float32)
+        self.net.setInput(self._dnn_input)
+        self.net.forward()
+            
+    def _export_tflite(self):
+        """Convert the Keras model to TFLite at this precision unless it was converted before"""
+        if os.path.exists(self.tflite_path):
+            return
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        if self.precision == 'fp16':
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            converter.target_spec.supported_types = [tf.float16]
+        elif self.precision == 'int8':
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            converter.representative_dataset = self._representative_dataset
+            converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+            converter.inference_input_type = tf.uint8
+        
+        # Write under a temporary name so an interrupted conversion is not reused
+        tmp_path = self.tflite_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(converter.convert())
+        os.replace(tmp_path, self.tflite_path)
+            
+    def _init_tflite(self):
+        """Load the TFLite model into an interpreter with a preallocated input"""
+        self._export_tflite()
+        self.interpreter = tf.lite.Interpreter(
+            model_path=self.tflite_path,
+            num_threads=max(1, (os.cpu_count() or 2) - 1)
+        )
+        self.interpreter.allocate_tensors()
+        input_details = self.interpreter.get_input_details()[0]
+        self._input_index = input_details['index']
+        self._output_index = self.interpreter.get_output_details()[0]['index']
+        self._input_buf = np.empty(input_details['shape'], input_details['dtype'])
+        
+        # Skeleton images are already uint8; only rescale if calibration picked another range
+        scale, zero_point = input_details['quantization']
+        self._input_quant = None
+        if input_details['dtype'] == np.uint8 and (scale, zero_point) != (1.0, 0):
+            self._input_quant = (scale, zero_point)
+            
+    def _representative_dataset(self, samples=100):
+        """Yield skeleton images from the training data for int8 calibration"""
+        paths = sorted(glob.glob(os.path.join(self.calibration_dir, '*', '*.jpg')))
+        for path in paths[::max(1, len(paths) // samples)][:samples]:
+            image = cv2.imread(path)
+            if image is not None and image.shape == (400, 400, 3):
+                yield [image[None].astype(np.float32)]
+        
+    def predict(self, image):
+        """Return the class probabilities for a single 400x400x3 image"""
+        if self.session is not None:
+            self._onnx_input[0] = image
+            self._binding.bind_cpu_input(self._onnx_input_name, self._onnx_input)
+            self.session.run_with_iobinding(self._binding)
+            return np.array(self._binding.copy_outputs_to_cpu()[0][0], dtype='float32')
+            
+        if self.net is not None:
+            self._dnn_input[0] = image
+            self.net.setInput(self._dnn_input)
+            return np.array(self.net.forward()[0], dtype='float32')
+            
+        if self.interpreter is None:
+            return np.array(self.model.predict_on_batch(image[None])[0], dtype='float32')
+            
+        if self._input_quant is None:
+            self._input_buf[0] = image
+        else:
+            scale, zero_point = self._input_quant
+            self._input_buf[0] = np.clip(np.rint(image / scale + zero_point), 0, 255)
+        self.interpreter.set_tensor(self._input_index, self._input_buf)
+        self.interpreter.invoke()
+        return np.array(self.interpreter.get_tensor(self._output_index)[0], dtype='float32')
 
 
 # ==================== Two-Way Translator Application ====================
@@ -124,6 +220,32 @@ class ASLImageGenerator:
 class TwoWayTranslatorApp:
     """Main application combining ASL-to-Voice and Voice-to-ASL"""
     
+    # Landmark chains of the hand skeleton: thumb, four fingers, palm outline
+    HAND_CHAINS = [np.array(chain) for chain in (
+        (0, 1, 2, 3, 4), (5, 6, 7, 8), (9, 10, 11, 12),
+        (13, 14, 15, 16), (17, 18, 19, 20), (0, 5, 9, 13, 17, 0),
+    )]
+    
+    # (dy, dx) pixels of a landmark dot, taken from cv2.circle(radius=2, thickness=1)
+    _DOT_OFFSETS = np.argwhere(cv2.circle(np.zeros((5, 5), np.uint8), (2, 2), 2, 1, 1)) - 2
+    
+    # Squared landmark distance thresholds used by the prediction rules
+    _DIST_C_O_SQ = 42 * 42
+    _DIST_G_H_SQ = 72 * 72
+    _DIST_Y_J_SQ = 42 * 42
+    
+    # PIP joints and fingertips of the index, middle, ring and pinky fingers
+    _FINGER_PIPS = [6, 10, 14, 18]
+    _FINGER_TIPS = [8, 12, 16, 20]
+    # Space gesture: index and pinky extended, middle and ring folded
+    _SPACE_SIGNS = np.array([1, -1, -1, 1])
+    
+    # Landmarks moving less than this many pixels reuse the previous prediction
+    STILL_HAND_PX = 4
+    
+    # Largest size a letter image is shown at in the voice-to-ASL panel
+    ASL_DISPLAY_SIZE = (350, 350)
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("🤟 Two-Way Sign Language Translator")
@@ -135,37 +257,72 @@ class TwoWayTranslatorApp:
         
         # ASL to Voice components
         self.vs = None
-        self.model = None
-        self.speak_engine = pyttsx3.init()
-        self.speak_engine.setProperty("rate", 100)
-        voices = self.speak_engine.getProperty("voices")
-        self.speak_engine.setProperty("voice", voices[0].id)
+        self.classifier = None
+        self._rgb_buf = np.empty((CAM_HEIGHT, CAM_WIDTH, 3), np.uint8)
+        self._camera_photo = None
+        self._hand_photo = None
+        self._white = np.full((400, 400, 3), 255, np.uint8)
+        
+        # Capture -> inference -> Tk pipeline
+        self._stop_event = threading.Event()
+        self._frame_wanted = threading.Event()
+        self._state_lock = threading.Lock()
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._result_queue = queue.Queue(maxsize=1)
+        self._pipeline_threads = []
+        self._drain_after_id = None
+        
+        # Text-to-speech runs on its own thread, which owns the pyttsx3 engine
+        self._speech_queue = queue.Queue()
+        self._speech_thread = threading.Thread(target=self.speech_loop, daemon=True)
+        self._speech_thread.start()
         
         # Voice to ASL components
         self.recognizer = sr.Recognizer()
         self.image_generator = ASLImageGenerator()
+        # Letters load on the generator's worker; PhotoImages are made on first display
+        self.image_generator.prewarm()
+        self._photo_by_letter = {}
         self.current_images = []
         self.animation_index = 0
         self.is_playing = False
+        self._after_ids = []
         
         # ASL recognition state
         self.ct = {'blank': 0}
         for i in ascii_uppercase:
             self.ct[i] = 0
         self.str = " "
+        self._current_word = ""
         self.word = " "
         self.current_symbol = ""
         self.prev_char = ""
         self.count = -1
         self.ten_prev_char = [" "] * 10
-        self.ccc = 0
-        self.pts = []
+        self.pts = np.empty((0, 3), np.int32)
+        self._prev_pts_xy = None
+        self._prev_prob = None
+        self._rule_handlers = {
+            0: self._rule_0_SAE,
+            1: self._rule_1_BDF,
+            2: self._rule_2_CO,
+            3: self._rule_3_GH,
+            4: lambda pts: 'L',
+            5: lambda pts: 'P',
+            6: lambda pts: 'X',
+            7: self._rule_7_YJ,
+        }
         
         self.word1 = " "
         self.word2 = " "
         self.word3 = " "
         self.word4 = " "
         
+        # Spelling suggestions are looked up off the recognition path
+        self._suggest_pool = ThreadPoolExecutor(max_workers=1)
+        self._suggest_future = None
+        self._last_suggest_word = None
+        
         self.setup_ui()
         self.root.protocol('WM_DELETE_WINDOW', self.destructor)
         
@@ -396,131 +553,243 @@ class TwoWayTranslatorApp:
     def start_camera(self):
         """Start the camera for ASL recognition"""
         if self.vs is None:
-            self.vs = cv2.VideoCapture(0)
-        if self.model is None:
+            self.vs = self.open_camera(0)
+        if self.classifier is None:
             try:
-                self.model = load_model('cnn8grps_rad1_model.h5')
-                print("Model loaded successfully")
+                self.classifier = SignClassifier('cnn8grps_rad1_model.h5')
+                print(f"Model loaded successfully ({self.classifier.backend})")
             except Exception as e:
                 print(f"Error loading model: {e}")
                 messagebox.showerror("Error", f"Could not load model: {e}")
                 return
-        self.video_loop()
+        self.start_pipeline()
+        
+    def open_camera(self, index):
+        """Open the webcam for low latency: native backend, MJPG, one-frame buffer"""
+        if sys.platform.startswith('win'):
+            vs = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+        elif sys.platform.startswith('linux'):
+            vs = cv2.VideoCapture(index, cv2.CAP_V4L2)
+        else:
+            vs = cv2.VideoCapture(index)
+        if not vs.isOpened():
+            vs = cv2.VideoCapture(index)
+            
+        vs.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        vs.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        vs.set(cv2.CAP_PROP_FPS, 30)
+        vs.set(cv2.CAP_PROP_FRAME_WIDTH, CAM_WIDTH)
+        vs.set(cv2.CAP_PROP_FRAME_HEIGHT, CAM_HEIGHT)
+        frame_size = (int(vs.get(cv2.CAP_PROP_FRAME_WIDTH)), int(vs.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        if frame_size != (CAM_WIDTH, CAM_HEIGHT):
+            print(f"Camera delivers {frame_size[0]}x{frame_size[1]}, frames will be resized")
+        return vs
         
     def stop_camera(self):
         """Stop the camera"""
+        self.stop_pipeline()
         if self.vs is not None:
             self.vs.release()
             self.vs = None
             
-    def video_loop(self):
-        """Main video loop for ASL recognition"""
-        if self.current_mode.get() != 'asl_to_voice' or self.vs is None:
+    def start_pipeline(self):
+        """Start the capture and inference threads and the Tk result poller"""
+        if self._pipeline_threads:
             return
+        self._stop_event.clear()
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._result_queue = queue.Queue(maxsize=1)
+        self._pipeline_threads = [
+            threading.Thread(target=self.capture_loop, args=(self.vs,), daemon=True),
+            threading.Thread(target=self.inference_loop, daemon=True),
+        ]
+        for thread in self._pipeline_threads:
+            thread.start()
+        self.drain_results()
+        
+    def stop_pipeline(self):
+        """Signal the pipeline threads to exit and stop polling for results"""
+        self._stop_event.set()
+        for thread in self._pipeline_threads:
+            thread.join(timeout=1)
+        self._pipeline_threads = []
+        if self._drain_after_id is not None:
+            self.root.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
             
-        try:
-            ok, frame = self.vs.read()
-            if not ok:
-                self.root.after(30, self.video_loop)
-                return
-                
-            cv2image = cv2.flip(frame, 1)
-            hands = hd.findHands(cv2image, draw=False, flipType=True)
-            cv2image_copy = np.array(cv2image)
-            cv2image_rgb = cv2.cvtColor(cv2image, cv2.COLOR_BGR2RGB)
+    def capture_loop(self, vs):
+        """Capture thread: keep grabbing, decode only when inference wants a frame"""
+        while not self._stop_event.is_set():
+            if not vs.grab():
+                time.sleep(0.03)
+                continue
+            if not self._frame_wanted.is_set():
+                continue
+            ok, frame = vs.retrieve()
+            if ok:
+                self._frame_wanted.clear()
+                # Mirror in place: retrieve() already gave us a fresh buffer
+                put_latest(self._frame_queue, cv2.flip(frame, 1, dst=frame))
             
-            # Display camera feed - larger size
-            current_image = Image.fromarray(cv2image_rgb)
-            current_image = current_image.resize((640, 480), Image.Resampling.LANCZOS)
-            imgtk = ImageTk.PhotoImage(image=current_image)
-            self.camera_panel.imgtk = imgtk
-            self.camera_panel.config(image=imgtk)
+    def inference_loop(self):
+        """Inference thread: hand detection, skeleton drawing and prediction"""
+        while not self._stop_event.is_set():
+            self._frame_wanted.set()
+            try:
+                frame = self._frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                result = self.process_frame(frame)
+            except Exception as e:
+                print(f"Video loop error: {e}")
+                continue
+            put_latest(self._result_queue, result)
             
-            if hands[0]:
-                hand = hands[0]
-                handmap = hand[0]
-                x, y, w, h = handmap['bbox']
-                image = cv2image_copy[max(0, y - offset):y + h + offset, 
-                                      max(0, x - offset):x + w + offset]
+    def process_frame(self, cv2image):
+        """Run recognition on a mirrored BGR frame and return the result to display"""
+        result = {'frame': cv2image, 'hand': None}
+        hands = hd.findHands(cv2image, draw=False, flipType=True)
+        
+        if hands[0]:
+            hand = hands[0]
+            handmap = hand[0]
+            x, y, w, h = handmap['bbox']
+            x0, y0 = max(0, x - offset), max(0, y - offset)
+            image = cv2image[y0:y + h + offset, x0:x + w + offset]
+            
+            white = self._white
+            white.fill(255)
+            
+            if image.size > 0:
+                # Reuse the full-frame landmarks, shifted into the crop's coordinates
+                self.pts = np.asarray(handmap['lmList'], dtype=np.int32)
+                self.pts[:, :2] -= np.array((x0, y0), np.int32)
                 
-                white = np.ones((400, 400, 3), np.uint8) * 255
+                os_x = ((400 - w) // 2) - 15
+                os_y = ((400 - h) // 2) - 15
                 
-                if image.size > 0:
-                    handz = hd2.findHands(image, draw=False, flipType=True)
-                    self.ccc += 1
-                    
-                    if handz[0]:
-                        hand2 = handz[0]
-                        handmap2 = hand2[0]
-                        self.pts = handmap2['lmList']
-                        
-                        os_x = ((400 - w) // 2) - 15
-                        os_y = ((400 - h) // 2) - 15
-                        
-                        # Draw hand skeleton
-                        for t in range(0, 4):
-                            cv2.line(white, (self.pts[t][0] + os_x, self.pts[t][1] + os_y),
-                                    (self.pts[t + 1][0] + os_x, self.pts[t + 1][1] + os_y), (0, 255, 0), 3)
-                        for t in range(5, 8):
-                            cv2.line(white, (self.pts[t][0] + os_x, self.pts[t][1] + os_y),
-                                    (self.pts[t + 1][0] + os_x, self.pts[t + 1][1] + os_y), (0, 255, 0), 3)
-                        for t in range(9, 12):
-                            cv2.line(white, (self.pts[t][0] + os_x, self.pts[t][1] + os_y),
-                                    (self.pts[t + 1][0] + os_x, self.pts[t + 1][1] + os_y), (0, 255, 0), 3)
-                        for t in range(13, 16):
-                            cv2.line(white, (self.pts[t][0] + os_x, self.pts[t][1] + os_y),
-                                    (self.pts[t + 1][0] + os_x, self.pts[t + 1][1] + os_y), (0, 255, 0), 3)
-                        for t in range(17, 20):
-                            cv2.line(white, (self.pts[t][0] + os_x, self.pts[t][1] + os_y),
-                                    (self.pts[t + 1][0] + os_x, self.pts[t + 1][1] + os_y), (0, 255, 0), 3)
-                        
-                        cv2.line(white, (self.pts[5][0] + os_x, self.pts[5][1] + os_y),
-                                (self.pts[9][0] + os_x, self.pts[9][1] + os_y), (0, 255, 0), 3)
-                        cv2.line(white, (self.pts[9][0] + os_x, self.pts[9][1] + os_y),
-                                (self.pts[13][0] + os_x, self.pts[13][1] + os_y), (0, 255, 0), 3)
-                        cv2.line(white, (self.pts[13][0] + os_x, self.pts[13][1] + os_y),
-                                (self.pts[17][0] + os_x, self.pts[17][1] + os_y), (0, 255, 0), 3)
-                        cv2.line(white, (self.pts[0][0] + os_x, self.pts[0][1] + os_y),
-                                (self.pts[5][0] + os_x, self.pts[5][1] + os_y), (0, 255, 0), 3)
-                        cv2.line(white, (self.pts[0][0] + os_x, self.pts[0][1] + os_y),
-                                (self.pts[17][0] + os_x, self.pts[17][1] + os_y), (0, 255, 0), 3)
-                        
-                        for i in range(21):
-                            cv2.circle(white, (self.pts[i][0] + os_x, self.pts[i][1] + os_y), 2, (0, 0, 255), 1)
-                        
-                        self.predict(white)
-                        
-                        # Display hand tracking - larger size
-                        hand_image = Image.fromarray(white)
-                        hand_image = hand_image.resize((400, 400), Image.Resampling.LANCZOS)
-                        handtk = ImageTk.PhotoImage(image=hand_image)
-                        self.hand_panel.imgtk = handtk
-                        self.hand_panel.config(image=handtk)
-                        
-                        # Update UI
-                        self.char_label.config(text=self.current_symbol)
-                        self.sentence_label.config(text=self.str.strip())
-                        self.sugg_btn1.config(text=self.word1)
-                        self.sugg_btn2.config(text=self.word2)
-                        self.sugg_btn3.config(text=self.word3)
-                        self.sugg_btn4.config(text=self.word4)
-                        
+                # Draw hand skeleton
+                pts_xy = self.pts[:, :2] + np.array((os_x, os_y), np.int32)
+                cv2.polylines(white, [pts_xy[chain] for chain in self.HAND_CHAINS],
+                              False, (0, 255, 0), 3)
+                
+                ys = (pts_xy[:, 1, None] + self._DOT_OFFSETS[:, 0]).ravel()
+                xs = (pts_xy[:, 0, None] + self._DOT_OFFSETS[:, 1]).ravel()
+                inside = (ys >= 0) & (ys < 400) & (xs >= 0) & (xs < 400)
+                white[ys[inside], xs[inside]] = (0, 0, 255)
+                
+                # The CNN runs unlocked; only the text-state update holds the lock
+                prob = self.classify(white)
+                with self._state_lock:
+                    if prob is not None:
+                        self.predict(prob)
+                    result['symbol'] = self.current_symbol
+                    result['sentence'] = self.str.strip()
+                
+                # PIL copies the canvas, so it can be handed to the Tk thread
+                result['hand'] = Image.fromarray(white)
+                
+        return result
+        
+    def drain_results(self):
+        """Tk side of the pipeline: show the latest result and poll again"""
+        self._drain_after_id = None
+        if self.current_mode.get() != 'asl_to_voice' or self._stop_event.is_set():
+            return
+            
+        try:
+            self.show_result(self._result_queue.get_nowait())
+        except queue.Empty:
+            pass
         except Exception as e:
             print(f"Video loop error: {e}")
+        self.poll_suggestions()
+            
+        self._drain_after_id = self.root.after(15, self.drain_results)
+        
+    def show_result(self, result):
+        """Update the camera/hand panels and labels from a pipeline result"""
+        self.show_camera_frame(result['frame'])
+        if result['hand'] is None:
+            return
             
-        self.root.after(30, self.video_loop)
+        # Display hand tracking
+        if self._hand_photo is None:
+            self._hand_photo = ImageTk.PhotoImage(image=result['hand'])
+            self.hand_panel.config(image=self._hand_photo)
+        else:
+            self._hand_photo.paste(result['hand'])
         
-    def distance(self, x, y):
-        """Calculate distance between two points"""
-        return math.sqrt(((x[0] - y[0]) ** 2) + ((x[1] - y[1]) ** 2))
+        # Update UI
+        self.char_label.config(text=result['symbol'])
+        self.sentence_label.config(text=result['sentence'])
         
-    def predict(self, test_image):
-        """Predict ASL letter from hand image"""
-        if self.model is None or len(self.pts) < 21:
+    def poll_suggestions(self):
+        """Show the suggestions from a finished lookup; otherwise keep the current ones"""
+        # Cheap unlocked check first; this runs every 15 ms
+        future = self._suggest_future
+        if future is None or not future.done():
+            return
+        with self._state_lock:
+            # A newer lookup (or clear_text) may have replaced it meanwhile
+            if self._suggest_future is not future:
+                return
+            self._suggest_future = None
+        try:
+            suggestions = future.result(timeout=0)
+        except Exception as e:
+            print(f"Suggestion lookup error: {e}")
             return
+        # word1-4 are only touched on the Tk thread
+        self.word1 = suggestions[0] if len(suggestions) >= 1 else " "
+        self.word2 = suggestions[1] if len(suggestions) >= 2 else " "
+        self.word3 = suggestions[2] if len(suggestions) >= 3 else " "
+        self.word4 = suggestions[3] if len(suggestions) >= 4 else " "
+        self.update_suggestion_buttons()
+        
+    def update_suggestion_buttons(self):
+        """Refresh the suggestion button labels"""
+        self.sugg_btn1.config(text=self.word1)
+        self.sugg_btn2.config(text=self.word2)
+        self.sugg_btn3.config(text=self.word3)
+        self.sugg_btn4.config(text=self.word4)
+        
+    def show_camera_frame(self, frame):
+        """Show a BGR frame on the camera panel, reusing one RGB buffer and PhotoImage"""
+        if frame.shape[:2] != (CAM_HEIGHT, CAM_WIDTH):
+            frame = cv2.resize(frame, (CAM_WIDTH, CAM_HEIGHT), interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        current_image = Image.frombuffer('RGB', (CAM_WIDTH, CAM_HEIGHT), self._rgb_buf, 'raw', 'RGB', 0, 1)
+        
+        if self._camera_photo is None:
+            self._camera_photo = ImageTk.PhotoImage(image=current_image)
+            self.camera_panel.config(image=self._camera_photo)
+        else:
+            self._camera_photo.paste(current_image)
+        
+    def distance_sq(self, x, y):
+        """Calculate the squared distance between two points"""
+        d = x[:2] - y[:2]
+        return np.dot(d, d)
+        
+    def classify(self, test_image):
+        """Class probabilities for the hand image, or None without a classifier or full hand"""
+        if self.classifier is None or len(self.pts) < 21:
+            return None
             
-        white = test_image.reshape(1, 400, 400, 3)
-        prob = np.array(self.model.predict(white, verbose=0)[0], dtype='float32')
+        # A held gesture gives the same prediction, so skip the CNN until the hand moves
+        pts_xy = self.pts[:, :2]
+        if self._prev_pts_xy is not None and \
+           np.max(np.abs(pts_xy - self._prev_pts_xy)) < self.STILL_HAND_PX:
+            return self._prev_prob.copy()
+        prob = self.classifier.predict(test_image)
+        self._prev_pts_xy = pts_xy.copy()
+        self._prev_prob = prob.copy()
+        return prob
+        
+    def predict(self, prob):
+        """Turn class probabilities into an ASL letter and update the text; caller holds _state_lock"""
         ch1 = np.argmax(prob, axis=0)
         prob[ch1] = 0
         ch2 = np.argmax(prob, axis=0)
@@ -528,49 +797,24 @@ class TwoWayTranslatorApp:
         pl = [ch1, ch2]
         
         # Apply prediction rules (simplified from original)
-        # Group conditions for letter recognition
-        if ch1 == 0:
-            ch1 = 'S'
-            if self.pts[4][0] < self.pts[6][0]:
-                ch1 = 'A'
-            if self.pts[4][1] > self.pts[8][1]:
-                ch1 = 'E'
-        elif ch1 == 2:
-            ch1 = 'C' if self.distance(self.pts[12], self.pts[4]) > 42 else 'O'
-        elif ch1 == 3:
-            ch1 = 'G' if self.distance(self.pts[8], self.pts[12]) > 72 else 'H'
-        elif ch1 == 4:
-            ch1 = 'L'
-        elif ch1 == 5:
-            ch1 = 'P'
-        elif ch1 == 6:
-            ch1 = 'X'
-        elif ch1 == 7:
-            ch1 = 'Y' if self.distance(self.pts[8], self.pts[4]) > 42 else 'J'
-        elif ch1 == 1:
-            if self.pts[6][1] > self.pts[8][1] and self.pts[10][1] > self.pts[12][1]:
-                ch1 = 'B'
-            elif self.pts[6][1] > self.pts[8][1] and self.pts[10][1] < self.pts[12][1]:
-                ch1 = 'D'
-            else:
-                ch1 = 'F'
-        
-        # Check for special gestures
-        if self.pts[6][1] > self.pts[8][1] and self.pts[10][1] < self.pts[12][1] and \
-           self.pts[14][1] < self.pts[16][1] and self.pts[18][1] > self.pts[20][1]:
+        # Each CNN group maps to a handler that picks the letter within the group
+        ch1 = self._rule_handlers[int(ch1)](self.pts)
+        
+        # Check for special gestures; finger_dy > 0 where a fingertip is above its PIP joint
+        finger_dy = self.pts[self._FINGER_PIPS, 1] - self.pts[self._FINGER_TIPS, 1]
+        if np.array_equal(np.sign(finger_dy), self._SPACE_SIGNS):
             ch1 = " "
             
-        if self.pts[4][0] < self.pts[5][0] and self.pts[6][1] > self.pts[8][1] and \
-           self.pts[10][1] > self.pts[12][1] and self.pts[14][1] > self.pts[16][1]:
+        if self.pts[4, 0] < self.pts[5, 0] and np.all(finger_dy[:3] > 0):
             ch1 = "next"
             
         # Handle character addition
         if ch1 == "next" and self.prev_char != "next":
             if self.ten_prev_char[(self.count - 2) % 10] != "next":
                 if self.ten_prev_char[(self.count - 2) % 10] == "Backspace":
-                    self.str = self.str[:-1]
+                    self.backspace()
                 else:
-                    self.str = self.str + self.ten_prev_char[(self.count - 2) % 10]
+                    self.append_char(self.ten_prev_char[(self.count - 2) % 10])
                     
         self.prev_char = ch1
         self.current_symbol = ch1 if isinstance(ch1, str) else ""
@@ -578,34 +822,103 @@ class TwoWayTranslatorApp:
         self.ten_prev_char[self.count % 10] = ch1
         
         # Update word suggestions
-        if len(self.str.strip()) != 0:
-            st = self.str.rfind(" ")
-            word = self.str[st + 1:]
-            self.word = word
-            if len(word.strip()) != 0:
-                suggestions = ddd.suggest(word)
-                self.word1 = suggestions[0] if len(suggestions) >= 1 else " "
-                self.word2 = suggestions[1] if len(suggestions) >= 2 else " "
-                self.word3 = suggestions[2] if len(suggestions) >= 3 else " "
-                self.word4 = suggestions[3] if len(suggestions) >= 4 else " "
+        word = self._current_word
+        self.word = word
+        if word and word != self._last_suggest_word:
+            self._last_suggest_word = word
+            self._suggest_future = self._suggest_pool.submit(suggest_words, word)
+                
+    def _rule_0_SAE(self, pts):
+        """Group 0: S, A or E from the thumb position"""
+        ch = 'S'
+        if pts[4, 0] < pts[6, 0]:
+            ch = 'A'
+        if pts[4, 1] > pts[8, 1]:
+            ch = 'E'
+        return ch
+        
+    def _rule_1_BDF(self, pts):
+        """Group 1: B, D or F from which fingers are raised"""
+        if np.all(pts[[6, 10], 1] > pts[[8, 12], 1]):
+            return 'B'
+        if pts[6, 1] > pts[8, 1] and pts[10, 1] < pts[12, 1]:
+            return 'D'
+        return 'F'
+        
+    def _rule_2_CO(self, pts):
+        """Group 2: C when thumb and middle finger are apart, else O"""
+        return 'C' if self.distance_sq(pts[12], pts[4]) > self._DIST_C_O_SQ else 'O'
+        
+    def _rule_3_GH(self, pts):
+        """Group 3: G when index and middle finger are apart, else H"""
+        return 'G' if self.distance_sq(pts[8], pts[12]) > self._DIST_G_H_SQ else 'H'
+        
+    def _rule_7_YJ(self, pts):
+        """Group 7: Y when thumb and index are apart, else J"""
+        return 'Y' if self.distance_sq(pts[8], pts[4]) > self._DIST_Y_J_SQ else 'J'
+        
+    def append_char(self, char):
+        """Append a recognized character to the sentence and the current word"""
+        self.str += char
+        if char == " ":
+            self._current_word = ""
+        else:
+            self._current_word += char
+            
+    def backspace(self):
+        """Remove the last character of the sentence"""
+        self.str = self.str[:-1]
+        if self._current_word:
+            self._current_word = self._current_word[:-1]
+        else:
+            # Deleted a space, so the previous word is being edited again
+            self._current_word = self.str[self.str.rfind(" ") + 1:]
                 
     def apply_suggestion(self, num):
         """Apply word suggestion"""
-        words = [self.word1, self.word2, self.word3, self.word4]
-        if num <= len(words) and words[num - 1].strip():
-            idx_space = self.str.rfind(" ")
-            self.str = self.str[:idx_space + 1] + words[num - 1].upper()
+        with self._state_lock:
+            words = [self.word1, self.word2, self.word3, self.word4]
+            if num <= len(words) and words[num - 1].strip():
+                word_start = len(self.str) - len(self._current_word)
+                suggestion = words[num - 1].upper()
+                self.str = self.str[:word_start] + suggestion
+                # Suggestions can be several words ("NEW YORK"); only the last one is current
+                self._current_word = suggestion.rsplit(' ', 1)[-1]
             
     def speak_text(self):
         """Speak the recognized text"""
-        if self.str.strip():
-            self.speak_engine.say(self.str)
-            self.speak_engine.runAndWait()
+        with self._state_lock:
+            text = self.str
+        if text.strip():
+            self._speech_queue.put(text)
+            
+    def speech_loop(self):
+        """TTS thread: speak queued text until a None sentinel arrives"""
+        try:
+            engine = pyttsx3.init()
+            engine.setProperty("rate", 100)
+            voices = engine.getProperty("voices")
+            engine.setProperty("voice", voices[0].id)
+        except Exception as e:
+            print(f"Text-to-speech unavailable: {e}")
+            return
+            
+        while True:
+            text = self._speech_queue.get()
+            if text is None:
+                break
+            engine.say(text)
+            engine.runAndWait()
             
     def clear_text(self):
         """Clear recognized text"""
-        self.str = " "
-        self.word1 = self.word2 = self.word3 = self.word4 = " "
+        with self._state_lock:
+            self.str = " "
+            self._current_word = ""
+            self.word1 = self.word2 = self.word3 = self.word4 = " "
+            self._suggest_future = None
+            self._last_suggest_word = None
+        self.update_suggestion_buttons()
         self.sentence_label.config(text="")
         self.char_label.config(text="")
         
@@ -614,7 +927,7 @@ class TwoWayTranslatorApp:
         """Start listening for voice input"""
         self.listen_btn.config(state='disabled')
         self.voice_status.config(text="🎤 Listening... Speak now!", fg='#00ff00')
-        self.root.update()
+        self.root.update_idletasks()
         
         thread = threading.Thread(target=self.listen_thread)
         thread.daemon = True
@@ -652,48 +965,67 @@ class TwoWayTranslatorApp:
             
     def display_asl(self, text):
         """Display ASL for text"""
+        # Resolve every frame's PhotoImage before playback so ticks do no image work
         self.current_images = []
         for word in text.split():
             clean_word = ''.join(c for c in word if c.isalnum())
             for char in clean_word:
                 if char.isalpha():
-                    image = self.image_generator.create_asl_image(char)
-                    self.current_images.append({'type': 'letter', 'char': char, 'image': image})
+                    self.current_images.append({'type': 'letter', 'char': char,
+                                                'photo': self.get_asl_photo(char)})
                     
         if not self.current_images:
             return
             
+        self.cancel_timeline()
         self.animation_index = 0
         self.is_playing = True
         self.stop_btn.config(state='normal')
         self.progress_bar['maximum'] = len(self.current_images)
         self.progress_bar['value'] = 0
-        self.animate_next()
-        
-    def animate_next(self):
-        """Animate next ASL sign"""
-        if not self.is_playing or self.animation_index >= len(self.current_images):
-            self.is_playing = False
-            self.stop_btn.config(state='disabled')
-            self.voice_status.config(text="✅ Complete! Click to listen again.", fg='#00d9ff')
-            return
-            
-        current = self.current_images[self.animation_index]
-        self.progress_bar['value'] = self.animation_index + 1
-        self.current_char_label.config(text=f"Letter: {current['char'].upper()}")
-        self.progress_label.config(text=f"Fingerspelling: {current['char'].upper()}")
-        
-        image = current['image'].copy()
-        image.thumbnail((350, 350), Image.Resampling.LANCZOS)
-        photo = ImageTk.PhotoImage(image)
-        self.asl_image_label.config(image=photo, text='')
-        self.asl_image_label.image = photo
         
-        self.animation_index += 1
-        self.root.after(800, self.animate_next)
+        # Schedule the whole sequence up front at fixed offsets from now
+        for idx, sign in enumerate(self.current_images):
+            self._after_ids.append(
+                self.root.after(idx * 800, lambda s=sign, i=idx: self._show_frame(s, i)))
+        self._after_ids.append(
+            self.root.after(len(self.current_images) * 800, self.finish_animation))
+        
+    def _show_frame(self, sign, idx):
+        """Show one scheduled ASL sign"""
+        self.animation_index = idx + 1
+        self.progress_bar['value'] = idx + 1
+        self.current_char_label.config(text=f"Letter: {sign['char'].upper()}")
+        self.progress_label.config(text=f"Fingerspelling: {sign['char'].upper()}")
+        
+        self.asl_image_label.config(image=sign['photo'], text='')
+        
+    def finish_animation(self):
+        """Mark the scheduled sequence as complete"""
+        self._after_ids.clear()
+        self.is_playing = False
+        self.stop_btn.config(state='disabled')
+        self.voice_status.config(text="✅ Complete! Click to listen again.", fg='#00d9ff')
+        
+    def cancel_timeline(self):
+        """Cancel every frame still waiting to be shown"""
+        for after_id in self._after_ids:
+            self.root.after_cancel(after_id)
+        self._after_ids.clear()
+        
+    def get_asl_photo(self, char):
+        """Return the display PhotoImage for a letter, building it on first use"""
+        char = char.lower()
+        photo = self._photo_by_letter.get(char)
+        if photo is None:
+            photo = ImageTk.PhotoImage(
+                self.image_generator.create_asl_image(char, display_size=self.ASL_DISPLAY_SIZE))
+            self._photo_by_letter[char] = photo
+        return photo
         
     def stop_animation(self):
         """Stop animation"""
+        self.cancel_timeline()
         self.is_playing = False
         self.stop_btn.config(state='disabled')
         self.voice_status.config(text="Animation stopped.", fg='#a0a0a0')
@@ -701,6 +1033,8 @@ class TwoWayTranslatorApp:
     def destructor(self):
         """Clean up resources"""
         self.stop_camera()
+        self._suggest_pool.shutdown(wait=False)
+        self._speech_queue.put(None)
         self.root.destroy()
         cv2.destroyAllWindows()
         
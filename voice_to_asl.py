@@ -3,14 +3,62 @@ Voice to American Sign Language (ASL) Translator
 Converts spoken words to ASL fingerspelling images using locally generated signs.
 """
 
-import speech_recognition as sr
 import os
 import sys
 import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk, ImageDraw, ImageFont
+from PIL import Image, ImageTk, ImageDraw, ImageFont, ImageColor
 import threading
+import queue
+import io
+import numpy as np
+import json
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from string import ascii_lowercase, punctuation
+
+# speech_recognition pulls in PyAudio and is slow to import, so it is only loaded
+# when the microphone is first used (see _load_speech_recognition); faster-whisper
+# is likewise imported by ASLTranslator._get_whisper on the first transcription
+sr = None
+
+try:
+    from vosk import Model as VoskModel, KaldiRecognizer
+except ImportError:
+    VoskModel = None
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+
+def _load_speech_recognition():
+    """Import speech_recognition on first use and publish it as the module-level sr"""
+    global sr
+    if sr is None:
+        import speech_recognition
+        sr = speech_recognition
+    return sr
+
+
+# Deletes ASCII punctuation so "don't" stays one word, as the old per-char filter did
+_PUNCTUATION_TABLE = str.maketrans('', '', punctuation)
+
+# Fingertip offsets from the palm centre for the fallback hand outline
+_DEFAULT_FINGERS = ((0, -80), (-30, -70), (30, -70), (-50, -40), (50, -40))  # All fingers
+_FINGER_LAYOUT = {
+    **dict.fromkeys('aemnst', ()),                        # Fist
+    'g': ((40, 0),),                                      # Pointing sideways
+    'h': ((40, -10), (40, 10)),                           # Two fingers sideways
+    **dict.fromkeys('ij', ((40, -60),)),                  # Pinky only
+    'l': ((0, -80), (50, -40)),                           # L shape
+    'v': ((-15, -80), (15, -80)),                         # Peace
+    'w': ((-20, -80), (0, -80), (20, -80)),               # W
+    'y': ((-50, -40), (50, -40)),                         # Thumb and pinky
+}
 
 
 class ASLImageGenerator:
@@ -56,48 +104,174 @@ class ASLImageGenerator:
         'z': '☝️',
     }
     
+    # Rendered images and background tiles are shared by every generator in the
+    # process (both translator apps), keyed by letter/word and size
+    image_cache = {}
+    _bg_cache = {}
+    
+    # Disk reads and renders queued by prewarm run on one worker, off the Tk thread
+    _io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='asl-images')
+    _pending = {}
+    _pending_lock = threading.Lock()
+    
+    # Part of every cached PNG's name; bump it whenever the letter rendering changes
+    # so tiles saved by older versions are not served any more
+    RENDER_VERSION = 2
+    
     def __init__(self, cache_dir=None):
         self.cache_dir = cache_dir or os.path.join(os.path.dirname(__file__), 'asl_images')
         os.makedirs(self.cache_dir, exist_ok=True)
-        self.image_cache = {}
         
-    def create_asl_image(self, letter, size=(300, 300)):
-        """Create an ASL hand sign image for a letter"""
+        # Fonts are parsed once here and shared by every image. The fonts actually
+        # found are part of the cached PNG names, so tiles drawn with PIL's default
+        # font are kept apart from ones drawn once the real fonts are installed
+        self._font_names = []
+        self.emoji_font = self._load_font(["seguiemj.ttf", "C:/Windows/Fonts/seguiemj.ttf"], 80)
+        self.letter_font = self._load_font(["arial.ttf", "C:/Windows/Fonts/arial.ttf"], 60)
+        self.title_font = self._load_font(["arial.ttf", "C:/Windows/Fonts/arial.ttf"], 36)
+        self.desc_font = self._load_font(["arial.ttf", "C:/Windows/Fonts/arial.ttf"], 16)
+        self._font_tag = format(zlib.crc32('|'.join(self._font_names).encode()), '08x')
+        
+    def _load_font(self, candidates, size):
+        """Load the first available font from candidates, else PIL's default font"""
+        for name in candidates:
+            try:
+                font = ImageFont.truetype(name, size)
+            except OSError:
+                continue
+            self._font_names.append(name)
+            return font
+        self._font_names.append('default')
+        return ImageFont.load_default()
+        
+    def _background(self, shape, size, outline):
+        """Return a fresh copy of the cached background tile for this shape and size"""
+        key = (shape, size, outline)
+        template = self._bg_cache.get(key)
+        if template is None:
+            template = self._make_background(shape, size, outline)
+            self._bg_cache[key] = template
+        return template.copy()
+        
+    @staticmethod
+    def _make_background(shape, size, outline, margin=20, width=3, radius=20):
+        """Build an outlined ellipse or rounded-rectangle tile with NumPy masks"""
+        w, h = size
+        yy, xx = np.ogrid[:h, :w]
+        x0, y0, x1, y1 = margin, margin, w - margin, h - margin
+        
+        def inside(inset):
+            if shape == 'ellipse':
+                cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+                a, b = (x1 - x0 + 1) / 2 - inset, (y1 - y0 + 1) / 2 - inset
+                return ((xx - cx) / a) ** 2 + ((yy - cy) / b) ** 2 <= 1
+            # Rounded rectangle: distance past the inner corner square must fit the radius
+            dx = np.maximum(np.maximum(x0 + radius - xx, xx - (x1 - radius)), 0)
+            dy = np.maximum(np.maximum(y0 + radius - yy, yy - (y1 - radius)), 0)
+            return ((dx * dx + dy * dy <= (radius - inset) ** 2)
+                    & (xx >= x0 + inset) & (xx <= x1 - inset)
+                    & (yy >= y0 + inset) & (yy <= y1 - inset))
+        
+        bg = np.empty((h, w, 3), np.uint8)
+        bg[:] = ImageColor.getrgb('#1a1a2e')
+        bg[inside(0)] = ImageColor.getrgb(outline)
+        bg[inside(width)] = ImageColor.getrgb('#16213e')
+        return Image.fromarray(bg)
+        
+    def _disk_path(self, letter, size):
+        """Path of the PNG that caches a letter image between sessions"""
+        return os.path.join(self.cache_dir,
+                            f"{letter}_{size[0]}x{size[1]}_v{self.RENDER_VERSION}_{self._font_tag}.png")
+        
+    def prewarm(self, letters=ascii_lowercase, size=(300, 300)):
+        """Queue the given letters for loading on the background worker; returns the futures"""
+        futures = []
+        for letter in letters:
+            cache_key = f"{letter}_{size[0]}x{size[1]}"
+            with self._pending_lock:
+                future = self._pending.get(cache_key)
+                if future is None:
+                    future = self._io_pool.submit(self._load_letter, letter, size)
+                    self._pending[cache_key] = future
+            futures.append(future)
+        return futures
+        
+    def create_asl_image(self, letter, size=(300, 300), display_size=None):
+        """Create an ASL hand sign image for a letter
+        
+        With display_size the image is shrunk once to fit within it (never enlarged)
+        and that copy is cached too, so callers never resize per frame.
+        """
         letter = letter.lower()
+        img = self._letter_image(letter, size)
+        if display_size is None:
+            return img
+        
+        fit_key = f"{letter}_{size[0]}x{size[1]}@{display_size[0]}x{display_size[1]}"
+        fitted = self.image_cache.get(fit_key)
+        if fitted is None:
+            if img.width <= display_size[0] and img.height <= display_size[1]:
+                fitted = img
+            else:
+                fitted = img.copy()
+                fitted.thumbnail(display_size, Image.Resampling.LANCZOS)
+            self.image_cache[fit_key] = fitted
+        return fitted
         
+    def _letter_image(self, letter, size):
+        """Return the full-size image for a letter from memory, disk or a fresh render"""
         # Check cache first
         cache_key = f"{letter}_{size[0]}x{size[1]}"
         if cache_key in self.image_cache:
             return self.image_cache[cache_key]
         
-        # Create image with gradient background
-        img = Image.new('RGB', size, '#1a1a2e')
-        draw = ImageDraw.Draw(img)
+        # Wait for a queued background load rather than doing the work twice;
+        # letters nobody queued are loaded right here, on the caller's thread
+        future = self._pending.get(cache_key)
+        if future is not None:
+            return future.result()
+        return self._load_letter(letter, size)
+        
+    def _load_letter(self, letter, size):
+        """Read a letter image from disk, or render and save it, and cache it"""
+        cache_key = f"{letter}_{size[0]}x{size[1]}"
+        
+        # Then the images saved by earlier sessions
+        path = self._disk_path(letter, size)
+        if os.path.exists(path):
+            with Image.open(path) as stored:
+                img = stored.convert('RGB')
+        else:
+            img = self._render_asl_image(letter, size)
+            self._save_tile(img, path)
         
-        # Draw circular background
-        margin = 20
-        ellipse_bbox = [margin, margin, size[0] - margin, size[1] - margin]
-        draw.ellipse(ellipse_bbox, fill='#16213e', outline='#e94560', width=3)
+        self.image_cache[cache_key] = img
+        return img
+        
+    @staticmethod
+    def _save_tile(img, path):
+        """Write a rendered tile to the disk cache"""
+        try:
+            # Write under a temporary name so a concurrent reader never sees a partial file
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            img.save(tmp_path, format='PNG', optimize=True)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not cache ASL image {path}: {e}")
+        
+    def _render_asl_image(self, letter, size):
+        """Draw the ASL hand sign image for a letter"""
+        # Start from the shared circular background
+        img = self._background('ellipse', size, '#e94560')
+        draw = ImageDraw.Draw(img)
         
         # Get emoji and description
         emoji = self.ASL_EMOJIS.get(letter, '🤚')
         description = self.ASL_DESCRIPTIONS.get(letter, 'Hand sign')
         
-        # Try to load a font, fall back to default
-        try:
-            # Use a large font for the emoji representation
-            emoji_font = ImageFont.truetype("seguiemj.ttf", 80)
-            letter_font = ImageFont.truetype("arial.ttf", 60)
-            desc_font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            try:
-                emoji_font = ImageFont.truetype("C:/Windows/Fonts/seguiemj.ttf", 80)
-                letter_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 60)
-                desc_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 16)
-            except:
-                emoji_font = ImageFont.load_default()
-                letter_font = ImageFont.load_default()
-                desc_font = ImageFont.load_default()
+        emoji_font = self.emoji_font
+        letter_font = self.letter_font
+        desc_font = self.desc_font
         
         # Draw the letter at top
         letter_text = letter.upper()
@@ -114,7 +288,7 @@ class ASLImageGenerator:
             draw.text((emoji_x, 100), emoji, fill='white', font=emoji_font)
         except:
             # If emoji doesn't render, draw a hand outline
-            self._draw_hand_outline(draw, size, letter)
+            self._draw_hand_outline(img, draw, size, letter)
         
         # Draw description at bottom
         desc_bbox = draw.textbbox((0, 0), description, font=desc_font)
@@ -122,11 +296,9 @@ class ASLImageGenerator:
         desc_x = (size[0] - desc_width) // 2
         draw.text((desc_x, size[1] - 50), description, fill='#a0a0a0', font=desc_font)
         
-        # Cache and return
-        self.image_cache[cache_key] = img
         return img
     
-    def _draw_hand_outline(self, draw, size, letter):
+    def _draw_hand_outline(self, img, draw, size, letter):
         """Draw a simple hand outline as fallback"""
         center_x = size[0] // 2
         center_y = size[1] // 2
@@ -139,30 +311,23 @@ class ASLImageGenerator:
         # Fingers based on letter
         letter = letter.lower()
         
-        # Default: all fingers
-        fingers = [(0, -80), (-30, -70), (30, -70), (-50, -40), (50, -40)]
-        
-        if letter in 'aemnst':
-            fingers = []  # Fist
-        elif letter in 'g':
-            fingers = [(40, 0)]  # Pointing sideways
-        elif letter in 'h':
-            fingers = [(40, -10), (40, 10)]  # Two fingers sideways
-        elif letter in 'ij':
-            fingers = [(40, -60)]  # Pinky only
-        elif letter in 'l':
-            fingers = [(0, -80), (50, -40)]  # L shape
-        elif letter in 'v':
-            fingers = [(-15, -80), (15, -80)]  # Peace
-        elif letter in 'w':
-            fingers = [(-20, -80), (0, -80), (20, -80)]  # W
-        elif letter in 'y':
-            fingers = [(-50, -40), (50, -40)]  # Thumb and pinky
+        fingers = _FINGER_LAYOUT.get(letter, _DEFAULT_FINGERS)
+        if not fingers:
+            return
         
+        # Rasterise all finger ellipses (17x31 px, 1 px outline) as one mask pass
+        arr = np.array(img)
+        yy, xx = np.ogrid[:size[1], :size[0]]
+        outer = np.zeros(arr.shape[:2], bool)
+        inner = np.zeros(arr.shape[:2], bool)
         for dx, dy in fingers:
-            draw.ellipse([center_x + dx - 8, center_y + dy - 15,
-                         center_x + dx + 8, center_y + dy + 15],
-                        fill='#f0d9b5', outline='#d4a574', width=1)
+            nx = (xx - (center_x + dx)) ** 2
+            ny = (yy - (center_y + dy)) ** 2
+            outer |= nx / 8.5 ** 2 + ny / 15.5 ** 2 <= 1
+            inner |= nx / 7.5 ** 2 + ny / 14.5 ** 2 <= 1
+        arr[outer] = ImageColor.getrgb('#d4a574')
+        arr[inner] = ImageColor.getrgb('#f0d9b5')
+        img.paste(Image.fromarray(arr))
     
     def create_word_image(self, word, size=(300, 300)):
         """Create an image representing an ASL word sign"""
@@ -173,15 +338,10 @@ class ASLImageGenerator:
         if cache_key in self.image_cache:
             return self.image_cache[cache_key]
         
-        # Create image
-        img = Image.new('RGB', size, '#1a1a2e')
+        # Start from the shared rounded-rectangle background
+        img = self._background('rounded', size, '#00d9ff')
         draw = ImageDraw.Draw(img)
         
-        # Draw background
-        margin = 20
-        draw.rounded_rectangle([margin, margin, size[0] - margin, size[1] - margin],
-                              radius=20, fill='#16213e', outline='#00d9ff', width=3)
-        
         # Word-specific descriptions
         word_descriptions = {
             'hello': "Wave hand side to side 👋",
@@ -222,16 +382,8 @@ class ASLImageGenerator:
         
         description = word_descriptions.get(word, f"Sign for '{word}'")
         
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 36)
-            desc_font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            try:
-                title_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 36)
-                desc_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", 16)
-            except:
-                title_font = ImageFont.load_default()
-                desc_font = ImageFont.load_default()
+        title_font = self.title_font
+        desc_font = self.desc_font
         
         # Draw word
         word_text = word.upper()
@@ -244,25 +396,26 @@ class ASLImageGenerator:
         draw.text((size[0]//2 - 30, 120), "🤲", fill='white', font=title_font)
         
         # Draw description (word wrap if needed)
+        # Each word is measured once and line widths are accumulated
         lines = []
-        words = description.split()
-        current_line = ""
-        for w in words:
-            test_line = current_line + " " + w if current_line else w
-            bbox = draw.textbbox((0, 0), test_line, font=desc_font)
-            if bbox[2] - bbox[0] < size[0] - 60:
-                current_line = test_line
+        max_width = size[0] - 60
+        space_width = desc_font.getlength(" ")
+        current_line, current_width = [], 0
+        for w in description.split():
+            word_width = desc_font.getlength(w)
+            added = space_width + word_width if current_line else word_width
+            if not current_line or current_width + added < max_width:
+                current_line.append(w)
+                current_width += added
             else:
-                lines.append(current_line)
-                current_line = w
+                lines.append((" ".join(current_line), current_width))
+                current_line, current_width = [w], word_width
         if current_line:
-            lines.append(current_line)
+            lines.append((" ".join(current_line), current_width))
         
         y_offset = 200
-        for line in lines:
-            bbox = draw.textbbox((0, 0), line, font=desc_font)
-            line_width = bbox[2] - bbox[0]
-            line_x = (size[0] - line_width) // 2
+        for line, line_width in lines:
+            line_x = int(size[0] - line_width) // 2
             draw.text((line_x, y_offset), line, fill='#a0a0a0', font=desc_font)
             y_offset += 25
         
@@ -273,33 +426,57 @@ class ASLImageGenerator:
 class ASLTranslator:
     """Main class for Voice to ASL translation"""
     
-    # Common ASL words (these will show word signs instead of fingerspelling)
-    COMMON_WORDS = [
-        'hello', 'thank you', 'please', 'sorry', 'yes', 'no', 'help', 'love',
-        'friend', 'family', 'good', 'bad', 'name', 'what', 'where', 'when',
-        'why', 'how', 'water', 'food', 'eat', 'drink', 'home', 'work',
-        'school', 'learn', 'understand', 'know', 'want', 'need', 'like',
-        'nice', 'meet', 'welcome'
-    ]
-    
-    def __init__(self):
-        self.recognizer = sr.Recognizer()
+    def __init__(self, use_google_fallback=True):
+        self.recognizer = None  # Created with the microphone, on first listen
+        self.use_google_fallback = use_google_fallback
+        self._whisper = None
+        self._whisper_available = True
+        self._vosk = None
         self.image_generator = ASLImageGenerator()
         self.is_listening = False
         
+        # Calibrate the energy threshold once and reuse the same microphone;
+        # the lock keeps two listens from opening its stream at the same time
+        self._mic = None
+        self._mic_lock = threading.Lock()
+        self._calibrated = False
+        
+        # Fill the letter cache in the background so the UI is not held up
+        self.image_generator.prewarm()
+        
     def listen_to_voice(self):
         """Listen to microphone and convert speech to text"""
-        with sr.Microphone() as source:
-            print("🎤 Adjusting for ambient noise... Please wait.")
-            self.recognizer.adjust_for_ambient_noise(source, duration=1)
+        with self._mic_lock:
+            return self._listen_with(self._microphone())
+    
+    def _microphone(self):
+        """Return the shared microphone, created on first use; callers hold _mic_lock"""
+        if self._mic is None:
+            self.recognizer = _load_speech_recognition().Recognizer()
+            if webrtcvad is not None:
+                # WebRTC VAD takes 16-bit mono at 16 kHz in 30 ms (480 sample) frames
+                self._mic = sr.Microphone(sample_rate=16000, chunk_size=480)
+            else:
+                self._mic = sr.Microphone()
+        return self._mic
+    
+    def _listen_with(self, mic):
+        """Record one phrase from the microphone and transcribe it"""
+        with mic as source:
+            if not self._calibrated:
+                print("🎤 Adjusting for ambient noise... Please wait.")
+                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+                self._calibrated = True
             print("🎤 Listening... Speak now!")
             
             try:
-                audio = self.recognizer.listen(source, timeout=10, phrase_time_limit=15)
+                if webrtcvad is not None:
+                    audio = self._listen_vad(source, timeout=10, phrase_time_limit=15)
+                else:
+                    audio = self.recognizer.listen(source, timeout=10, phrase_time_limit=15)
                 print("🔄 Processing speech...")
                 
-                # Using Google's free speech recognition API
-                text = self.recognizer.recognize_google(audio)
+                text = self.transcribe(audio)
                 print(f"✅ Recognized: {text}")
                 return text.lower()
                 
@@ -310,43 +487,206 @@ class ASLTranslator:
                 print("❌ Could not understand the audio.")
                 return None
             except sr.RequestError as e:
-                print(f"❌ Could not request results from Google Speech Recognition service: {e}")
+                print(f"❌ Could not request results from the speech recognition service: {e}")
+                return None
+    
+    def _listen_vad(self, source, timeout, phrase_time_limit, hangover_ms=400, preroll_ms=300):
+        """Record one phrase, ending it once hangover_ms of silence follows speech
+        
+        Frames are classified by WebRTC VAD. A short pre-roll before the first voiced
+        frame is kept so the start of the first word is not clipped.
+        """
+        vad = webrtcvad.Vad(2)
+        frame_ms = 1000 * source.CHUNK // source.SAMPLE_RATE
+        hangover = hangover_ms // frame_ms
+        preroll = deque(maxlen=preroll_ms // frame_ms)
+        frames = []
+        silent = 0
+        waited_ms = 0
+        
+        while True:
+            frame = source.stream.read(source.CHUNK)
+            is_speech = vad.is_speech(frame, source.SAMPLE_RATE)
+            
+            if not frames:
+                # Still waiting for the phrase to start
+                preroll.append(frame)
+                if is_speech:
+                    frames.extend(preroll)
+                    continue
+                waited_ms += frame_ms
+                if waited_ms > timeout * 1000:
+                    raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                continue
+            
+            frames.append(frame)
+            silent = 0 if is_speech else silent + 1
+            if silent >= hangover or len(frames) * frame_ms >= phrase_time_limit * 1000:
+                break
+        
+        return sr.AudioData(b''.join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+    
+    def _get_vosk(self):
+        """Load the local Vosk model on first use, if it is installed"""
+        if self._vosk is None and VoskModel is not None:
+            try:
+                self._vosk = VoskModel(lang="en-us")
+            except Exception as e:
+                print(f"Could not load Vosk model, streaming is disabled: {e}")
                 return None
+        return self._vosk
+    
+    def listen_stream(self, on_word, on_revise=None, stable_polls=3, timeout=10, phrase_time_limit=15):
+        """Listen for one phrase, passing each word to on_word as soon as it stabilizes
+        
+        When Vosk later changes words it has already passed on, on_revise is called
+        with how many of the last passed words to take back before the corrected
+        ones go to on_word. Needs Vosk; without it this records and transcribes the
+        whole phrase via listen_to_voice and calls on_word for nothing. Returns the
+        full text.
+        """
+        model = self._get_vosk()
+        if model is None:
+            return self.listen_to_voice()
+        
+        spoken = []  # Words already passed to on_word
+        
+        def emit(words):
+            # Keep the longest common prefix and pass on only what follows it
+            common = 0
+            for old, new in zip(spoken, words):
+                if old != new:
+                    break
+                common += 1
+            if common < len(spoken):
+                if on_revise is not None:
+                    on_revise(len(spoken) - common)
+                del spoken[common:]
+            for word in words[common:]:
+                on_word(word)
+                spoken.append(word)
+        
+        with self._mic_lock:
+            with self._microphone() as source:
+                rec = KaldiRecognizer(model, source.SAMPLE_RATE)
+                print("🎤 Listening... Speak now!")
+                
+                previous, repeats = None, 0
+                heard = False
+                started = time.monotonic()
+                while True:
+                    elapsed = time.monotonic() - started
+                    if elapsed > phrase_time_limit or (not heard and elapsed > timeout):
+                        words = json.loads(rec.FinalResult())['text'].split()
+                        break
+                    
+                    if rec.AcceptWaveform(source.stream.read(source.CHUNK)):
+                        # End of utterance; silence before speech gives an empty result
+                        words = json.loads(rec.Result())['text'].split()
+                        if words:
+                            break
+                        continue
+                    
+                    partial = json.loads(rec.PartialResult())['partial'].split()
+                    heard = heard or bool(partial)
+                    
+                    # The last partial word may still be growing; earlier ones are
+                    # emitted once they survive stable_polls consecutive polls
+                    settled = partial[:-1]
+                    if settled == previous:
+                        repeats += 1
+                    else:
+                        previous, repeats = settled, 1
+                    if repeats >= stable_polls and settled != spoken:
+                        emit(settled)
+        
+        emit(words)
+        
+        if not words:
+            print("❌ Could not understand the audio.")
+            return None
+        text = " ".join(words)
+        print(f"✅ Recognized: {text}")
+        return text.lower()
+    
+    def _get_whisper(self):
+        """Load the local faster-whisper model on first use, if it is installed"""
+        if self._whisper is None and self._whisper_available:
+            try:
+                from faster_whisper import WhisperModel
+                self._whisper = WhisperModel("tiny.en", device="cpu", compute_type="int8")
+            except ImportError:
+                self._whisper_available = False
+            except Exception as e:
+                print(f"Could not load faster-whisper model, using Google instead: {e}")
+                self._whisper_available = False
+        return self._whisper
+    
+    def transcribe(self, audio):
+        """Transcribe recorded audio locally, falling back to Google's free web API"""
+        model = self._get_whisper()
+        if model is None:
+            return self.recognizer.recognize_google(audio)
+        
+        try:
+            wav = io.BytesIO(audio.get_wav_data(convert_rate=16000))
+            segments, _ = model.transcribe(wav, beam_size=1, vad_filter=True)
+            text = " ".join(segment.text.strip() for segment in segments).strip()
+        except Exception as e:
+            if self.use_google_fallback:
+                return self.recognizer.recognize_google(audio)
+            raise sr.RequestError(f"local transcription failed: {e}")
+        
+        # Match recognize_google, which raises when nothing was understood
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+    
+    def fingerspell(self, text, display_size=None):
+        """Flat list of ('letter', char, image) signs for every letter in text"""
+        create = self.image_generator.create_asl_image
+        return [('letter', char, create(char, display_size=display_size))
+                for char in text.lower() if char.isalpha()]
+    
+    def get_signs(self, text, display_size=None):
+        """Flat list of (type, char, image) signs for text; this translator only fingerspells"""
+        return self.fingerspell(text, display_size)
+
+
+class ASLTranslatorHybrid(ASLTranslator):
+    """Translator that shows a whole-word sign for common words and fingerspells the rest"""
+    
+    # Common ASL words (these will show word signs instead of fingerspelling)
+    COMMON_WORDS = {
+        'hello', 'thank you', 'please', 'sorry', 'yes', 'no', 'help', 'love',
+        'friend', 'family', 'good', 'bad', 'name', 'what', 'where', 'when',
+        'why', 'how', 'water', 'food', 'eat', 'drink', 'home', 'work',
+        'school', 'learn', 'understand', 'know', 'want', 'need', 'like',
+        'nice', 'meet', 'welcome'
+    }
     
-    def get_asl_for_word(self, word):
-        """Get ASL representation for a word - always fingerspell letter by letter"""
-        word = word.lower().strip()
-        
-        # Fingerspell every word letter by letter
-        result = []
-        for char in word:
-            if char.isalpha():
-                image = self.image_generator.create_asl_image(char)
-                result.append(('letter', char, image))
-        
-        return result
-    
-    def get_asl_for_text(self, text):
-        """Convert text to ASL representation"""
-        words = text.split()
-        result = []
-        
-        for word in words:
-            # Clean the word
-            clean_word = ''.join(c for c in word if c.isalnum())
-            if clean_word:
-                word_asl = self.get_asl_for_word(clean_word)
-                if word_asl:
-                    result.append((clean_word, word_asl))
-        
-        return result
+    def get_signs(self, text, display_size=None):
+        """Flat list of signs, using ('word', word, image) for common words"""
+        signs = []
+        for word in text.translate(_PUNCTUATION_TABLE).lower().split():
+            if word in self.COMMON_WORDS:
+                signs.append(('word', word, self.image_generator.create_word_image(word)))
+            else:
+                signs.extend(self.fingerspell(word, display_size))
+        return signs
 
 
 class ASLTranslatorGUI:
     """GUI for the Voice to ASL Translator"""
     
-    def __init__(self):
-        self.translator = ASLTranslator()
+    # Signs are fitted within this box before display
+    DISPLAY_SIZE = (350, 350)
+    # Most signs composited into one sprite sheet (16 x 350 px wide)
+    SHEET_CELLS = 16
+    
+    def __init__(self, translator=None):
+        # Pass an ASLTranslatorHybrid to show whole-word signs for common words
+        self.translator = translator or ASLTranslator()
         self.root = tk.Tk()
         self.root.title("🤟 Voice to ASL Translator")
         self.root.geometry("900x700")
@@ -355,9 +695,25 @@ class ASLTranslatorGUI:
         self.current_images = []
         self.animation_index = 0
         self.is_playing = False
+        self._after_ids = []
+        self._finish_id = None
+        self._timeline_end = 0.0
+        self._photo_refs = []
+        self._heard_words = []
+        
+        # Continuous dictation: the ASR thread produces utterances, the Tk thread drains them
+        # Items are (kind, payload): ('text', (words, signs)), ('revise', count),
+        # ('listen_done', (text, streamed, signs)) or ('dictation_done', None);
+        # both listen modes hand results over this way. Signs are looked up on the
+        # ASR thread, so a cold image cache never stalls the Tk mainloop
+        self.text_queue = queue.Queue()
+        # Stop event of the running dictation session, None when idle
+        self._dictation_stop = None
         
         self.setup_ui()
         
+        self.root.after(20, self._drain)
+        
     def setup_ui(self):
         """Setup the user interface"""
         # Title
@@ -429,14 +785,26 @@ class ASLTranslatorGUI:
         self.image_frame.pack(pady=20)
         self.image_frame.pack_propagate(False)
         
-        self.asl_image_label = tk.Label(
+        # One cell-sized canvas window onto the current sprite sheet;
+        # moving the image item selects which sign is visible
+        cell_w, cell_h = self.DISPLAY_SIZE
+        self.canvas = tk.Canvas(
             self.image_frame,
+            width=cell_w,
+            height=cell_h,
             bg='#0f3460',
+            highlightthickness=0
+        )
+        self.canvas.pack(expand=True)
+        self._sign_item = self.canvas.create_image(0, 0, anchor='nw')
+        self._shown_sheet = None
+        self._text_item = self.canvas.create_text(
+            cell_w // 2, cell_h // 2,
             text="ASL signs will appear here",
             font=('Helvetica', 14),
-            fg='#a0a0a0'
+            fill='#a0a0a0',
+            justify='center'
         )
-        self.asl_image_label.pack(expand=True)
         
         # Progress bar
         self.progress_frame = tk.Frame(self.root, bg='#1a1a2e')
@@ -491,6 +859,20 @@ class ASLTranslatorGUI:
         )
         self.stop_button.pack(side='left', padx=10)
         
+        self.dictate_button = tk.Button(
+            button_frame,
+            text="🔁 Dictate",
+            font=('Helvetica', 14, 'bold'),
+            fg='white',
+            bg='#0f3460',
+            activebackground='#16213e',
+            padx=30,
+            pady=10,
+            cursor='hand2',
+            command=self.toggle_dictation
+        )
+        self.dictate_button.pack(side='left', padx=10)
+        
         # Text input option
         input_frame = tk.Frame(self.root, bg='#1a1a2e')
         input_frame.pack(pady=10)
@@ -538,8 +920,13 @@ class ASLTranslatorGUI:
     def start_listening(self):
         """Start listening for voice input"""
         self.listen_button.config(state='disabled')
+        self.dictate_button.config(state='disabled')
         self.status_label.config(text="🎤 Listening... Speak now!", fg='#00ff00')
-        self.root.update()
+        self.root.update_idletasks()
+        
+        # Streamed words are appended to a fresh sequence
+        self.reset_animation()
+        self._heard_words = []
         
         # Run speech recognition in a separate thread
         thread = threading.Thread(target=self.listen_thread)
@@ -548,19 +935,122 @@ class ASLTranslatorGUI:
     
     def listen_thread(self):
         """Thread for speech recognition"""
-        text = self.translator.listen_to_voice()
+        streamed = []
         
-        # Update UI from main thread
-        self.root.after(0, lambda: self.process_recognized_text(text))
+        def on_word(word):
+            streamed.append(word)
+            self._queue_text(word)
+        
+        text, signs = None, None
+        try:
+            text = self.translator.listen_stream(on_word, self._queue_revision)
+            if text and not streamed:
+                signs = self.translator.get_signs(text, self.DISPLAY_SIZE)
+        finally:
+            # _drain hands this to the Tk thread after the words queued before it;
+            # it is queued even if listening failed so the buttons come back
+            self.text_queue.put(('listen_done', (text, bool(streamed), signs)))
+    
+    def _queue_text(self, text):
+        """Look up the signs for recognized text on this ASR thread and queue both for Tk"""
+        self.text_queue.put(('text', (text, self.translator.get_signs(text, self.DISPLAY_SIZE))))
+    
+    def _queue_revision(self, count):
+        """Tell the Tk thread that the last count streamed words were recognized differently"""
+        self.text_queue.put(('revise', count))
+    
+    def toggle_dictation(self):
+        """Start or stop continuous dictation"""
+        if self._dictation_stop is not None:
+            # The ASR thread exits after its current utterance; both buttons stay
+            # disabled until it reports ('dictation_done', None) through text_queue
+            self._dictation_stop.set()
+            self.dictate_button.config(text="⏳ Stopping...", state='disabled')
+            self.status_label.config(text="Stopping after the current utterance...", fg='#a0a0a0')
+            return
+        
+        self.reset_animation()
+        self._heard_words = []
+        self._dictation_stop = threading.Event()
+        self.dictate_button.config(text="⏹ Stop Dictation")
+        self.listen_button.config(state='disabled')
+        self.status_label.config(text="🎤 Dictating... speak whenever you like.", fg='#00ff00')
+        
+        thread = threading.Thread(target=self.dictation_loop, args=(self._dictation_stop,))
+        thread.daemon = True
+        thread.start()
+    
+    def dictation_loop(self, stop):
+        """Thread that keeps recognizing utterances and queues them until stop is set"""
+        try:
+            while not stop.is_set():
+                streamed = []
+                
+                def on_word(word):
+                    streamed.append(word)
+                    self._queue_text(word)
+                
+                text = self.translator.listen_stream(on_word, self._queue_revision)
+                # Without streaming the whole utterance arrives at once
+                if text and not streamed:
+                    self._queue_text(text)
+        finally:
+            self.text_queue.put(('dictation_done', None))
+    
+    def _drain(self):
+        """Handle everything the ASR threads have queued, then poll again"""
+        try:
+            while True:
+                kind, payload = self.text_queue.get_nowait()
+                if kind == 'text':
+                    self._append_and_display(*payload)
+                elif kind == 'revise':
+                    self._retract_words(payload)
+                elif kind == 'listen_done':
+                    text, streamed, signs = payload
+                    self.process_recognized_text(text, streamed=streamed, signs=signs)
+                elif kind == 'dictation_done':
+                    self._on_dictation_done()
+        except queue.Empty:
+            pass
+        self.root.after(20, self._drain)
     
-    def process_recognized_text(self, text):
-        """Process the recognized text"""
+    def _on_dictation_done(self):
+        """The dictation thread has exited and released the microphone"""
+        self._dictation_stop = None
+        self.dictate_button.config(text="🔁 Dictate", state='normal')
         self.listen_button.config(state='normal')
+        self.status_label.config(text="Dictation stopped.", fg='#a0a0a0')
+    
+    def _append_and_display(self, text, signs):
+        """Add recognized words to the transcript and queue their signs behind those playing"""
+        self._heard_words.extend(text.split())
+        self.text_display.config(text=' '.join(self._heard_words))
+        self.status_label.config(text="🎤 Showing ASL while you speak...", fg='#00ff00')
+        self.append_signs(self.make_entries(signs))
+    
+    def _retract_words(self, count):
+        """Drop the last count words from the transcript
+        
+        Their signs are already queued, so the corrected words that follow are
+        signed after them.
+        """
+        del self._heard_words[max(0, len(self._heard_words) - count):]
+        self.text_display.config(text=' '.join(self._heard_words))
+    
+    def process_recognized_text(self, text, streamed=False, signs=None):
+        """Process the recognized text; streamed words are already queued"""
+        self.listen_button.config(state='normal')
+        self.dictate_button.config(state='normal')
         
-        if text:
+        if text and streamed:
+            self.text_display.config(text=text)
+            if not self.is_playing:
+                self.status_label.config(text="✅ Complete! Click to listen again.", fg='#00d9ff')
+        elif text:
             self.text_display.config(text=text)
             self.status_label.config(text="✅ Speech recognized! Showing ASL...", fg='#00ff00')
-            self.display_asl(text)
+            self.display_asl(text, signs)
         else:
             self.status_label.config(text="❌ Could not recognize speech. Try again.", fg='#ff6b6b')
     
@@ -572,45 +1062,108 @@ class ASLTranslatorGUI:
             self.status_label.config(text="Showing ASL for typed text...", fg='#00d9ff')
             self.display_asl(text)
     
-    def display_asl(self, text):
-        """Display ASL for the given text"""
-        asl_data = self.translator.get_asl_for_text(text)
+    def display_asl(self, text, signs=None):
+        """Display ASL for the given text, using signs when they were looked up already"""
+        if signs is None:
+            signs = self.translator.get_signs(text, self.DISPLAY_SIZE)
         
-        if not asl_data:
+        if not signs:
             self.status_label.config(text="No displayable characters found.", fg='#ff6b6b')
             return
         
-        # Flatten all signs for animation
-        self.current_images = []
-        for word, signs in asl_data:
-            for sign_type, char, image in signs:
-                self.current_images.append({
-                    'type': sign_type,
-                    'char': char,
-                    'word': word if sign_type == 'word' else None,
-                    'image': image  # Now storing PIL Image directly
-                })
+        self.reset_animation()
+        self.append_signs(self.make_entries(signs))
+    
+    def make_entries(self, signs):
+        """Turn a flat list of (type, char, image) signs into animation entries"""
+        return [{
+            'type': sign_type,
+            'char': char,
+            'word': char if sign_type == 'word' else None,
+            'image': image,
+        } for sign_type, char, image in signs]
+    
+    def make_sheets(self, entries):
+        """Paste the entries' images side by side into sprite sheets, one Tk upload each
+        
+        Sets entry['sheet'] and entry['cell'] (its column) and returns the
+        PhotoImages. Sheets hold at most SHEET_CELLS signs to bound their size.
+        Images must already fit within DISPLAY_SIZE, as get_signs returns them.
+        """
+        cell_w, cell_h = self.DISPLAY_SIZE
+        photos = []
+        for start in range(0, len(entries), self.SHEET_CELLS):
+            batch = entries[start:start + self.SHEET_CELLS]
+            sheet = np.empty((cell_h, cell_w * len(batch), 3), np.uint8)
+            sheet[:] = ImageColor.getrgb('#0f3460')
+            for cell, entry in enumerate(batch):
+                if entry['image'] is None:
+                    continue
+                image = entry['image']
+                pixels = np.asarray(image if image.mode == 'RGB' else image.convert('RGB'))
+                h, w = pixels.shape[:2]
+                x = cell * cell_w + (cell_w - w) // 2
+                y = (cell_h - h) // 2
+                sheet[y:y + h, x:x + w] = pixels
+            
+            photo = ImageTk.PhotoImage(Image.fromarray(sheet))
+            for cell, entry in enumerate(batch):
+                entry['sheet'] = photo
+                entry['cell'] = cell
+            photos.append(photo)
+        return photos
+    
+    def append_signs(self, entries):
+        """Schedule entries after the last queued sign, starting playback if idle"""
+        if not entries:
+            return
         
-        self.animation_index = 0
-        self.is_playing = True
-        self.stop_button.config(state='normal')
+        now = time.monotonic()
+        offset = max(0, int((self._timeline_end - now) * 1000)) if self.is_playing else 0
+        if not self.is_playing:
+            self.is_playing = True
+            self.stop_button.config(state='normal')
+        
+        # The completion callback moves to after the new signs
+        if self._finish_id is not None:
+            self.root.after_cancel(self._finish_id)
+            self._after_ids.remove(self._finish_id)
+        
+        # Schedule every sign at its cumulative offset in a single pass
+        base = len(self.current_images)
+        self.current_images.extend(entries)
+        # Tk only draws a PhotoImage while Python holds a reference to it
+        self._photo_refs.extend(self.make_sheets(entries))
         self.progress_bar['maximum'] = len(self.current_images)
+        for idx, sign in enumerate(entries, base):
+            self._after_ids.append(
+                self.root.after(offset, lambda s=sign, i=idx: self._show_frame(s, i)))
+            offset += self.sign_delay(sign)
+        self._finish_id = self.root.after(offset, self.finish_animation)
+        self._after_ids.append(self._finish_id)
+        self._timeline_end = now + offset / 1000
+    
+    def reset_animation(self):
+        """Cancel playback and forget the queued signs"""
+        self.cancel_timeline()
+        self.current_images = []
+        self._photo_refs = []
+        self._shown_sheet = None
+        self.animation_index = 0
+        self.is_playing = False
         self.progress_bar['value'] = 0
-        
-        self.animate_next()
     
-    def animate_next(self):
-        """Show the next ASL sign in sequence"""
-        if not self.is_playing or self.animation_index >= len(self.current_images):
-            self.is_playing = False
-            self.stop_button.config(state='disabled')
-            self.status_label.config(text="✅ Complete! Click to listen again.", fg='#00d9ff')
-            return
-        
-        current = self.current_images[self.animation_index]
+    @staticmethod
+    def sign_delay(sign):
+        """How long a sign stays on screen, in milliseconds"""
+        return 1500 if sign['type'] == 'word' else 800
+    
+    def _show_frame(self, current, idx):
+        """Show one scheduled ASL sign"""
+        self.animation_index = idx + 1
         
         # Update progress
-        self.progress_bar['value'] = self.animation_index + 1
+        self.progress_bar['value'] = idx + 1
         
         if current['type'] == 'word':
             self.current_char_label.config(text=f"Word: {current['word'].upper()}")
@@ -619,31 +1172,43 @@ class ASLTranslatorGUI:
             self.current_char_label.config(text=f"Letter: {current['char'].upper()}")
             self.progress_label.config(text=f"Fingerspelling: {current['char'].upper()}")
         
-        # Display the locally generated image
-        image = current['image']
-        
-        if image:
-            # Resize image to fit frame
-            image = image.copy()
-            image.thumbnail((350, 350), Image.Resampling.LANCZOS)
-            
-            photo = ImageTk.PhotoImage(image)
-            self.asl_image_label.config(image=photo, text='')
-            self.asl_image_label.image = photo
+        # Display the locally generated image by sliding its sheet under the canvas
+        if current['image'] is not None:
+            if current['sheet'] is not self._shown_sheet:
+                self.canvas.itemconfig(self._sign_item, image=current['sheet'])
+                self._shown_sheet = current['sheet']
+            self.canvas.coords(self._sign_item, -current['cell'] * self.DISPLAY_SIZE[0], 0)
+            self.canvas.itemconfig(self._sign_item, state='normal')
+            self.canvas.itemconfig(self._text_item, state='hidden')
         else:
-            self.asl_image_label.config(
-                image='',
-                text=f"[{current['char'].upper()}]\n(Image unavailable)"
+            self.canvas.itemconfig(self._sign_item, state='hidden')
+            self.canvas.itemconfig(
+                self._text_item,
+                text=f"[{current['char'].upper()}]\n(Image unavailable)",
+                state='normal'
             )
-        
-        self.animation_index += 1
-        
-        # Schedule next animation
-        delay = 1500 if current['type'] == 'word' else 800
-        self.root.after(delay, self.animate_next)
+    
+    def finish_animation(self):
+        """Mark the scheduled sequence as complete"""
+        self._after_ids.clear()
+        self._finish_id = None
+        self.is_playing = False
+        self.stop_button.config(state='disabled')
+        if self._dictation_stop is not None:
+            self.status_label.config(text="🎤 Dictating... speak whenever you like.", fg='#00ff00')
+        else:
+            self.status_label.config(text="✅ Complete! Click to listen again.", fg='#00d9ff')
+    
+    def cancel_timeline(self):
+        """Cancel every sign still waiting to be shown"""
+        for after_id in self._after_ids:
+            self.root.after_cancel(after_id)
+        self._after_ids.clear()
+        self._finish_id = None
     
     def stop_animation(self):
         """Stop the current animation"""
+        self.cancel_timeline()
         self.is_playing = False
         self.stop_button.config(state='disabled')
         self.status_label.config(text="Animation stopped.", fg='#a0a0a0')
@@ -664,7 +1229,7 @@ def main():
     print()
     print("Requirements:")
     print("  - Microphone for voice input")
-    print("  - Internet connection for speech recognition")
+    print("  - Internet connection for speech recognition (not needed with faster-whisper)")
     print()
     print("Starting GUI...")
     print()